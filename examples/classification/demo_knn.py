@@ -2,6 +2,8 @@ import sys
 import os
 import random
 
+import numpy as np
+
 import heat as ht
 from heat.classification.kneighborsclassifier import KNeighborsClassifier
 
@@ -15,13 +17,7 @@ iris_path = pkg_resources.resource_filename(
 X = ht.load_hdf5(iris_path, dataset="data", split=0)
 
 # Generate keys for the iris.h5 dataset
-keys = []
-for i in range(50):
-    keys.append(0)
-for i in range(50, 100):
-    keys.append(1)
-for i in range(100, 150):
-    keys.append(2)
+keys = np.repeat(np.arange(3, dtype=np.int64), 50)
 Y = ht.array(keys, split=0)
 
 
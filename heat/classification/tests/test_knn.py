@@ -1,4 +1,7 @@
 import unittest
+
+import numpy as np
+
 import heat as ht
 
 from heat.classification.kneighborsclassifier import KNeighborsClassifier
@@ -11,13 +14,7 @@ class TestKNN(TestCase):
         x = ht.load_hdf5("heat/datasets/iris.h5", dataset="data")
 
         # generate keys for the iris.h5 dataset
-        keys = []
-        for i in range(50):
-            keys.append(0)
-        for i in range(50, 100):
-            keys.append(1)
-        for i in range(100, 150):
-            keys.append(2)
+        keys = np.repeat(np.arange(3, dtype=np.int64), 50)
         y = ht.array(keys)
 
         knn = KNeighborsClassifier(n_neighbors=5)
@@ -34,13 +31,7 @@ class TestKNN(TestCase):
         x = ht.load_hdf5("heat/datasets/iris.h5", dataset="data", split=0)
 
         # generate keys for the iris.h5 dataset
-        keys = []
-        for i in range(50):
-            keys.append(0)
-        for i in range(50, 100):
-            keys.append(1)
-        for i in range(100, 150):
-            keys.append(2)
+        keys = np.repeat(np.arange(3, dtype=np.int64), 50)
         y = ht.array(keys)
 
         knn = KNeighborsClassifier(n_neighbors=5)
@@ -85,23 +76,11 @@ class TestKNN(TestCase):
         x = ht.load_hdf5("heat/datasets/iris.h5", dataset="data")
 
         # keys as label array
-        keys = []
-        for i in range(50):
-            keys.append(0)
-        for i in range(50, 100):
-            keys.append(1)
-        for i in range(100, 150):
-            keys.append(2)
+        keys = np.repeat(np.arange(3, dtype=np.int64), 50)
         labels = ht.array(keys, split=0)
 
         # keys as one_hot
-        keys = []
-        for i in range(50):
-            keys.append([1, 0, 0])
-        for i in range(50, 100):
-            keys.append([0, 1, 0])
-        for i in range(100, 150):
-            keys.append([0, 0, 1])
+        keys = np.repeat(np.eye(3, dtype=np.int64), 50, axis=0)
         y = ht.array(keys)
 
         knn = KNeighborsClassifier(n_neighbors=5)
@@ -163,13 +163,9 @@ class _KCluster(ht.ClusteringMixin, ht.BaseEstimator):
                     D2.resplit_(axis=None)
                     prob = D2 / D2.sum()
                     random_position = ht.random.rand().item()
-                    sample = 0
-                    sum = 0
-                    for j in range(len(prob)):
-                        if sum > random_position:
-                            break
-                        sum += prob[j].item()
-                        sample = j
+                    # first sample whose cumulative probability exceeds the random position
+                    cumulative = ht.cumsum(prob, axis=0)
+                    sample = min((cumulative <= random_position).sum().item(), len(prob) - 1)
                     proc = 0
                     for p in range(x.comm.size):
                         if displ[p] > sample:
@@ -3,6 +3,8 @@ Module Implementing the Kmeans Algorithm
 """
 from typing import Optional, Union, TypeVar
 
+import torch
+
 import heat as ht
 from heat.cluster._kcluster import _KCluster
 from heat.core.dndarray import DNDarray
@@ -83,19 +85,23 @@ class KMeans(_KCluster):
 
         """
         new_cluster_centers = self._cluster_centers.copy()
-        for i in range(self.n_clusters):
-            # points in current cluster
-            selection = (matching_centroids == i).astype(ht.int64)
-            # accumulate points and total number of points in cluster
-            assigned_points = x * selection
-            points_in_cluster = selection.sum(axis=0, keepdim=True).clip(
-                1.0, ht.iinfo(ht.int64).max
-            )
-
-            # compute the new centroids
-            new_cluster_centers[i : i + 1, :] = (assigned_points / points_in_cluster).sum(
-                axis=0, keepdim=True
-            )
+        torch_type = ht.promote_types(x.dtype, ht.float32).torch_type()
+
+        # accumulate points and number of points per cluster locally, a column of ones counts them
+        points = torch.cat(
+            (x.larray.to(torch_type), torch.ones_like(x.larray[:, :1], dtype=torch_type)), dim=1
+        )
+        sums = torch.zeros(
+            (self.n_clusters, points.shape[1]), dtype=torch_type, device=points.device
+        )
+        sums.index_add_(0, matching_centroids.larray.flatten(), points)
+
+        # combine the partial sums and counts of all processes in a single collective
+        if x.split is not None:
+            x.comm.Allreduce(ht.MPI.IN_PLACE, sums, ht.MPI.SUM)
+
+        # compute the new centroids, empty clusters are moved to the origin
+        new_cluster_centers.larray[...] = sums[:, :-1] / sums[:, -1:].clamp(min=1.0)
 
         return new_cluster_centers
 
@@ -7,7 +7,8 @@ import numpy as np
 import torch
 import warnings
 
-from .communication import MPI, MPI_WORLD
+from .communication import MPI, MPI_WORLD, sanitize_comm
+from . import devices
 from . import factories
 from . import stride_tricks
 from . import sanitation
@@ -86,6 +87,27 @@ def __binary_op(
         )
     promoted_type = types.result_type(t1, t2).torch_type()
 
+    # Two scalars: no broadcasting or distribution involved, operate on the tensors directly
+    if np.isscalar(t1) and np.isscalar(t2) and out is None and where is None:
+        device = devices.get_device()
+        try:
+            s1 = torch.tensor(t1, device=device.torch_device).to(promoted_type)
+            s2 = torch.tensor(t2, device=device.torch_device).to(promoted_type)
+        except (ValueError, TypeError, RuntimeError):
+            raise TypeError(
+                "Data type not supported, inputs were {} and {}".format(type(t1), type(t2))
+            )
+        result = operation(s1, s2, **fn_kwargs)
+        return DNDarray(
+            result,
+            tuple(result.shape),
+            types.heat_type_of(result),
+            None,
+            device=device,
+            comm=sanitize_comm(None),
+            balanced=True,
+        )
+
     # Make inputs Dndarrays
     if np.isscalar(t1) and np.isscalar(t2):
         try:
@@ -273,26 +295,20 @@ def __cum_op(
     )
 
     if x.split is not None and axis == x.split:
-        indices = torch.tensor([cumop.shape[axis] - 1], device=cumop.device)
+        neutral_shape = cumop.shape[:axis] + torch.Size([1]) + cumop.shape[axis + 1 :]
+        # the carry of each process is the last element of its partial result
         send = (
-            torch.index_select(cumop, axis, indices)
-            if indices[0] >= 0
-            else torch.full(
-                cumop.shape[:axis] + torch.Size([1]) + cumop.shape[axis + 1 :],
-                neutral,
-                dtype=cumop.dtype,
-                device=cumop.device,
-            )
-        )
-        recv = torch.full(
-            cumop.shape[:axis] + torch.Size([1]) + cumop.shape[axis + 1 :],
-            neutral,
-            dtype=cumop.dtype,
-            device=cumop.device,
+            cumop.narrow(axis, cumop.shape[axis] - 1, 1)
+            if cumop.shape[axis] > 0
+            else torch.full(neutral_shape, neutral, dtype=cumop.dtype, device=cumop.device)
         )
+        recv = torch.full(neutral_shape, neutral, dtype=cumop.dtype, device=cumop.device)
 
+        # single exclusive scan of the carries, O(log P) instead of a chain of messages
         x.comm.Exscan(send, recv, exscan_op)
-        final_op(cumop, recv, out=cumop)
+        # the first process keeps the neutral element, no need to apply it
+        if x.comm.rank > 0:
+            final_op(cumop, recv, out=cumop)
 
     if out is not None:
         return out
@@ -443,11 +459,22 @@ def __reduce_op(
     else:
         output_shape = x.gshape
         for dim in axis:
-            if not (
-                partial.shape.numel() == 0 and partial_op.__name__ in ("local_max", "local_min")
-            ):  # no neutral element for max/min
-                partial = partial_op(partial, dim=dim, keepdim=True)
             output_shape = output_shape[:dim] + (1,) + output_shape[dim + 1 :]
+        single_pass = len(axis) > 1 and len(set(axis)) == len(axis)
+        if single_pass and partial_op is torch.sum:
+            # all axes are reduced in a single pass
+            partial = partial_op(partial, dim=axis, keepdim=True)
+        elif single_pass and partial_op is torch.prod and max(axis) - min(axis) == len(axis) - 1:
+            # adjacent axes are flattened (a view for contiguous data) and reduced in a single pass
+            keepdim_shape = tuple(1 if dim in axis else s for dim, s in enumerate(partial.shape))
+            partial = partial_op(partial.flatten(min(axis), max(axis)), dim=min(axis))
+            partial = partial.reshape(keepdim_shape)
+        else:
+            for dim in axis:
+                if not (
+                    partial.shape.numel() == 0 and partial_op.__name__ in ("local_max", "local_min")
+                ):  # no neutral element for max/min
+                    partial = partial_op(partial, dim=dim, keepdim=True)
         if not keepdim and not len(partial.shape) == 1:
             gshape_losedim = tuple(x.gshape[dim] for dim in range(len(x.gshape)) if dim not in axis)
             lshape_losedim = tuple(x.lshape[dim] for dim in range(len(x.lshape)) if dim not in axis)
@@ -60,7 +60,9 @@ __all__ = [
 ]
 
 
-def add(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
+def add(
+    t1: Union[DNDarray, float], t2: Union[DNDarray, float], out: Optional[DNDarray] = None
+) -> DNDarray:
     """
     Element-wise addition of values from two operands, commutative.
     Takes the first and second operand (scalar or :class:`~heat.core.dndarray.DNDarray`) whose elements are to be added
@@ -72,6 +74,9 @@ def add(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
         The first operand involved in the addition
     t2: DNDarray or scalar
         The second operand involved in the addition
+    out: DNDarray, optional
+        The output array. It must have a shape that the inputs broadcast to and matching split axis.
+        If not provided, a freshly allocated array is returned.
 
     Examples
     --------
@@ -88,13 +93,11 @@ def add(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
     DNDarray([[3., 4.],
               [5., 6.]], dtype=ht.float32, device=cpu:0, split=None)
     """
-    return _operations.__binary_op(torch.add, t1, t2)
+    return _operations.__binary_op(torch.add, t1, t2, out)
 
 
-DNDarray.__add__ = lambda self, other: add(self, other)
-DNDarray.__add__.__doc__ = add.__doc__
-DNDarray.__radd__ = lambda self, other: add(self, other)
-DNDarray.__radd__.__doc__ = add.__doc__
+DNDarray.__add__ = add
+DNDarray.__radd__ = add
 
 
 def bitwise_and(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
@@ -125,17 +128,13 @@ def bitwise_and(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDar
     >>> ht.bitwise_and(ht.array([True, True]), ht.array([False, True]))
     DNDarray([False,  True], dtype=ht.bool, device=cpu:0, split=None)
     """
-    dtypes = (heat_type_of(t1), heat_type_of(t2))
-
-    for dt in dtypes:
-        if heat_type_is_inexact(dt):
-            raise TypeError("Operation is not supported for float types")
+    if heat_type_is_inexact(heat_type_of(t1)) or heat_type_is_inexact(heat_type_of(t2)):
+        raise TypeError("Operation is not supported for float types")
 
     return _operations.__binary_op(torch.Tensor.__and__, t1, t2)
 
 
-DNDarray.__and__ = lambda self, other: bitwise_and(self, other)
-DNDarray.__and__.__doc__ = bitwise_and.__doc__
+DNDarray.__and__ = bitwise_and
 
 
 def bitwise_or(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
@@ -169,17 +168,13 @@ def bitwise_or(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarr
     >>> ht.bitwise_or(ht.array([True, True]), ht.array([False, True]))
     DNDarray([True, True], dtype=ht.bool, device=cpu:0, split=None)
     """
-    dtypes = (heat_type_of(t1), heat_type_of(t2))
-
-    for dt in dtypes:
-        if heat_type_is_inexact(dt):
-            raise TypeError("Operation is not supported for float types")
+    if heat_type_is_inexact(heat_type_of(t1)) or heat_type_is_inexact(heat_type_of(t2)):
+        raise TypeError("Operation is not supported for float types")
 
     return _operations.__binary_op(torch.Tensor.__or__, t1, t2)
 
 
-DNDarray.__or__ = lambda self, other: bitwise_or(self, other)
-DNDarray.__or__.__doc__ = bitwise_or.__doc__
+DNDarray.__or__ = bitwise_or
 
 
 def bitwise_xor(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
@@ -208,17 +203,13 @@ def bitwise_xor(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDar
     >>> ht.bitwise_xor(ht.array([True, True]), ht.array([False, True]))
     DNDarray([ True, False], dtype=ht.bool, device=cpu:0, split=None)
     """
-    dtypes = (heat_type_of(t1), heat_type_of(t2))
-
-    for dt in dtypes:
-        if heat_type_is_inexact(dt):
-            raise TypeError("Operation is not supported for float types")
+    if heat_type_is_inexact(heat_type_of(t1)) or heat_type_is_inexact(heat_type_of(t2)):
+        raise TypeError("Operation is not supported for float types")
 
     return _operations.__binary_op(torch.Tensor.__xor__, t1, t2)
 
 
-DNDarray.__xor__ = lambda self, other: bitwise_xor(self, other)
-DNDarray.__xor__.__doc__ = bitwise_xor.__doc__
+DNDarray.__xor__ = bitwise_xor
 
 
 def cumprod(a: DNDarray, axis: int, dtype: datatype = None, out=None) -> DNDarray:
@@ -368,65 +359,106 @@ def diff(
                     # append
                     a = manipulations.concatenate((a, p_el), axis=axis)
 
-    if not a.is_distributed():
-        ret = a.copy()
+    gshape = a.gshape[:axis] + (max(a.gshape[axis] - n, 0),) + a.gshape[axis + 1 :]
+
+    if not a.is_distributed() or axis != a.split:
+        # all elements along axis are process-local, the n-th difference is computed in one go
+        return DNDarray(
+            __local_diff(a.larray, n, axis),
+            gshape,
+            a.dtype,
+            a.split,
+            device=a.device,
+            comm=a.comm,
+            balanced=a.balanced,
+        )
+
+    if gshape[axis] == 0:
+        # n >= a.shape[axis], nothing is left to difference
+        return factories.empty(gshape, dtype=a.dtype, split=a.split, device=a.device, comm=a.comm)
+
+    counts = a.lshape_map[:, axis]
+    if n > 1 and ((counts > 0) & (counts < n)).any():
+        # the first n elements along axis are spread over several processes, difference iteratively
+        ret = a
         for _ in range(n):
-            axis_slice = [slice(None)] * len(ret.shape)
-            axis_slice[axis] = slice(1, None, None)
-            axis_slice_end = [slice(None)] * len(ret.shape)
-            axis_slice_end[axis] = slice(None, -1, None)
-            ret = ret[tuple(axis_slice)] - ret[tuple(axis_slice_end)]
+            ret = diff(ret, axis=axis)
         return ret
 
-    size = a.comm.size
+    # the halo is exchanged between neighboring processes that hold data, empty ones are skipped
     rank = a.comm.rank
-    ret = a.copy()
-    # work loop, runs n times. using the result at the end of the loop as the starting values for each loop
-    for _ in range(n):
-        axis_slice = [slice(None)] * len(ret.shape)
-        axis_slice[axis] = slice(1, None, None)
-        axis_slice_end = [slice(None)] * len(ret.shape)
-        axis_slice_end[axis] = slice(None, -1, None)
-
-        # build the slice for the first element on the specified axis
-        arb_slice = [slice(None)] * len(a.shape)
-        arb_slice[axis] = 0
-        # send the first element of the array to rank - 1
-        if rank > 0:
-            snd = ret.comm.Isend(ret.lloc[arb_slice].clone(), dest=rank - 1, tag=rank)
-
-        # standard logic for the diff with the next element
-        dif = ret.lloc[axis_slice] - ret.lloc[axis_slice_end]
-        # need to slice out to select the proper elements of out
-        diff_slice = [slice(x) for x in dif.shape]
-        ret.lloc[diff_slice] = dif
-
-        if rank > 0:
-            snd.Wait()  # wait for the send to finish
-        if rank < size - 1:
-            cr_slice = [slice(None)] * len(a.shape)
-            # slice of 1 element in the selected axis for the shape creation
-            cr_slice[axis] = 1
-            recv_data = torch.ones(
-                ret.lloc[cr_slice].shape, dtype=ret.dtype.torch_type(), device=a.device.torch_device
-            )
-            rec = ret.comm.Irecv(recv_data, source=rank + 1, tag=rank + 1)
-            axis_slice_end = [slice(None)] * len(a.shape)
-            # select the last elements in the selected axis
-            axis_slice_end[axis] = slice(-1, None)
-            rec.Wait()
-            # diff logic
-            ret.lloc[axis_slice_end] = (
-                recv_data.reshape(ret.lloc[axis_slice_end].shape) - ret.lloc[axis_slice_end]
-            )
-
-    axis_slice_end = [slice(None, None, None)] * len(a.shape)
-    axis_slice_end[axis] = slice(None, -1 * n, None)
-    ret = ret[tuple(axis_slice_end)]  # slice off the last element on the array (nonsense data)
+    local = a.larray
+    populated = torch.nonzero(counts).flatten().tolist()
+    prev_rank, next_rank = None, None
+    if rank in populated:
+        index = populated.index(rank)
+        if index > 0:
+            prev_rank = populated[index - 1]
+        if index < len(populated) - 1:
+            next_rank = populated[index + 1]
+
+    # post the receive of the first n elements of the next process ahead of the local work
+    if next_rank is not None:
+        halo_shape = local.shape[:axis] + (n,) + local.shape[axis + 1 :]
+        recv_data = torch.empty(halo_shape, dtype=local.dtype, device=a.device.torch_device)
+        rec = a.comm.Irecv(recv_data, source=next_rank, tag=next_rank)
+    # send the first n elements of the array to the previous process
+    if prev_rank is not None:
+        snd = a.comm.Isend(local.narrow(axis, 0, n), dest=prev_rank, tag=rank)
+
+    # the result is allocated once, all but the last populated process keep their number of elements
+    length = max(local.shape[axis] - n, 0)
+    dif_shape = list(local.shape)
+    dif_shape[axis] = length if next_rank is None else length + n
+    dif = torch.empty(dif_shape, dtype=local.dtype, device=a.device.torch_device)
+
+    # differences within the local chunk, computed while the halo is in flight
+    __local_diff(local, n, axis, out=dif.narrow(axis, 0, length))
+
+    if next_rank is not None:
+        rec.Wait()
+        # the last n differences require the first n elements of rank + 1
+        if n == 1:
+            torch.sub(recv_data, local.narrow(axis, length, 1), out=dif.narrow(axis, length, 1))
+        else:
+            boundary = torch.cat((local.narrow(axis, length, n), recv_data), dim=axis)
+            __local_diff(boundary, n, axis, out=dif.narrow(axis, length, n))
+    if prev_rank is not None:
+        snd.Wait()  # wait for the send to finish
+
+    ret = DNDarray(dif, gshape, a.dtype, a.split, device=a.device, comm=a.comm, balanced=False)
     ret.balance_()  # balance the array before returning
     return ret
 
 
+def __local_diff(
+    x: torch.Tensor, n: int, axis: int, out: Optional[torch.Tensor] = None
+) -> torch.Tensor:
+    """
+    Process-local n-th discrete difference of a ``torch.Tensor`` along ``axis``. Every pass subtracts two
+    overlapping views of ``x`` in a single kernel, mirroring ``torch.diff`` (not available for torch<1.8).
+
+    Parameters
+    ----------
+    x : torch.Tensor
+        Input tensor
+    n : int
+        The number of times values are differenced
+    axis : int
+        The axis along which the difference is taken
+    out : torch.Tensor, optional
+        Buffer the last difference is written to. If not provided, a freshly allocated tensor is returned.
+    """
+    for i in range(n):
+        length = max(x.shape[axis] - 1, 0)
+        x = torch.sub(
+            x.narrow(axis, x.shape[axis] - length, length),
+            x.narrow(axis, 0, length),
+            out=out if i == n - 1 else None,
+        )
+    return x
+
+
 def div(
     t1: Union[DNDarray, float],
     t2: Union[DNDarray, float],
@@ -470,8 +502,7 @@ def div(
     return _operations.__binary_op(torch.true_divide, t1, t2, out, where)
 
 
-DNDarray.__truediv__ = lambda self, other: div(self, other)
-DNDarray.__truediv__.__doc__ = div.__doc__
+DNDarray.__truediv__ = div
 DNDarray.__rtruediv__ = lambda self, other: div(other, self)
 DNDarray.__rtruediv__.__doc__ = div.__doc__
 
@@ -537,8 +568,7 @@ def floordiv(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray
         return _operations.__binary_op(torch.floor_divide, t1, t2)
 
 
-DNDarray.__floordiv__ = lambda self, other: floordiv(self, other)
-DNDarray.__floordiv__.__doc__ = floordiv.__doc__
+DNDarray.__floordiv__ = floordiv
 DNDarray.__rfloordiv__ = lambda self, other: floordiv(other, self)
 DNDarray.__rfloordiv__.__doc__ = floordiv.__doc__
 
@@ -566,16 +596,13 @@ def invert(a: DNDarray, out: DNDarray = None) -> DNDarray:
     >>> ht.bitwise_not(ht.array([-1, -2, 3], dtype=ht.int8))
     DNDarray([ 0,  1, -4], dtype=ht.int8, device=cpu:0, split=None)
     """
-    dt = heat_type_of(a)
-
-    if heat_type_is_inexact(dt):
+    if heat_type_is_inexact(heat_type_of(a)):
         raise TypeError("Operation is not supported for float types")
 
     return _operations.__local_op(torch.bitwise_not, a, out, no_cast=True)
 
 
-DNDarray.__invert__ = lambda self, out=None: invert(self, out)
-DNDarray.__invert__.__doc__ = invert.__doc__
+DNDarray.__invert__ = invert
 
 # alias for invert
 bitwise_not = invert
@@ -598,19 +625,13 @@ def left_shift(t1: DNDarray, t2: Union[DNDarray, float]) -> DNDarray:
     >>> ht.left_shift(ht.array([1,2,3]), 1)
     DNDarray([2, 4, 6], dtype=ht.int64, device=cpu:0, split=None)
     """
-    dtypes = (heat_type_of(t1), heat_type_of(t2))
-    arrs = [t1, t2]
-    for dt in range(2):
-        if heat_type_is_inexact(dtypes[dt]):
-            raise TypeError("Operation is not supported for float types")
-        elif dtypes[dt] == types.bool:
-            arrs[dt] = types.int(arrs[dt])
+    if heat_type_is_inexact(heat_type_of(t1)) or heat_type_is_inexact(heat_type_of(t2)):
+        raise TypeError("Operation is not supported for float types")
 
     return _operations.__binary_op(torch.Tensor.__lshift__, t1, t2)
 
 
-DNDarray.__lshift__ = lambda self, other: left_shift(self, other)
-DNDarray.__lshift__.__doc__ = left_shift.__doc__
+DNDarray.__lshift__ = left_shift
 
 
 def mod(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
@@ -643,13 +664,14 @@ def mod(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
     return remainder(t1, t2)
 
 
-DNDarray.__mod__ = lambda self, other: mod(self, other)
-DNDarray.__mod__.__doc__ = mod.__doc__
+DNDarray.__mod__ = mod
 DNDarray.__rmod__ = lambda self, other: mod(other, self)
 DNDarray.__rmod__.__doc__ = mod.__doc__
 
 
-def mul(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
+def mul(
+    t1: Union[DNDarray, float], t2: Union[DNDarray, float], out: Optional[DNDarray] = None
+) -> DNDarray:
     """
     Element-wise multiplication (NOT matrix multiplication) of values from two operands, commutative.
     Takes the first and second operand (scalar or :class:`~heat.core.dndarray.DNDarray`) whose elements are to be
@@ -661,6 +683,9 @@ def mul(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
         The first operand involved in the multiplication
     t2: DNDarray or scalar
         The second operand involved in the multiplication
+    out: DNDarray, optional
+        The output array. It must have a shape that the inputs broadcast to and matching split axis.
+        If not provided, a freshly allocated array is returned.
 
     Examples
     --------
@@ -680,13 +705,11 @@ def mul(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
     DNDarray([[2., 4.],
               [6., 8.]], dtype=ht.float32, device=cpu:0, split=None)
     """
-    return _operations.__binary_op(torch.mul, t1, t2)
+    return _operations.__binary_op(torch.mul, t1, t2, out)
 
 
-DNDarray.__mul__ = lambda self, other: mul(self, other)
-DNDarray.__mul__.__doc__ = mul.__doc__
-DNDarray.__rmul__ = lambda self, other: mul(self, other)
-DNDarray.__rmul__.__doc__ = mul.__doc__
+DNDarray.__mul__ = mul
+DNDarray.__rmul__ = mul
 
 # Alias in compliance with numpy API
 multiply = mul
@@ -716,8 +739,7 @@ def neg(a: DNDarray, out: Optional[DNDarray] = None) -> DNDarray:
     return _operations.__local_op(torch.neg, a, out, no_cast=True)
 
 
-DNDarray.__neg__ = lambda self: neg(self)
-DNDarray.__neg__.__doc__ = neg.__doc__
+DNDarray.__neg__ = neg
 
 # Alias in compliance with numpy API
 negative = neg
@@ -759,8 +781,7 @@ def pos(a: DNDarray, out: Optional[DNDarray] = None) -> DNDarray:
     return a.copy()
 
 
-DNDarray.__pos__ = lambda self: pos(self)
-DNDarray.__pos__.__doc__ = pos.__doc__
+DNDarray.__pos__ = pos
 
 # Alias in compliance with numpy API
 positive = pos
@@ -793,11 +814,19 @@ def pow(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
     DNDarray([[ 1.,  8.],
             [27., 64.]], dtype=ht.float32, device=cpu:0, split=None)
     """
+    # small integer exponents, e.g. squared distances, are cheaper as repeated multiplications
+    if isinstance(t1, DNDarray) and type(t2) is int and 2 <= t2 <= 4 and t1.dtype is not types.bool:
+        square = mul(t1, t1)
+        if t2 == 2:
+            return square
+        if t2 == 3:
+            return mul(square, t1)
+        return mul(square, square)
+
     return _operations.__binary_op(torch.pow, t1, t2)
 
 
-DNDarray.__pow__ = lambda self, other: pow(self, other)
-DNDarray.__pow__.__doc__ = pow.__doc__
+DNDarray.__pow__ = pow
 DNDarray.__rpow__ = lambda self, other: pow(other, self)
 DNDarray.__rpow__.__doc__ = pow.__doc__
 
@@ -852,19 +881,13 @@ def right_shift(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDar
     >>> ht.right_shift(ht.array([1,2,3]), 1)
     DNDarray([0, 1, 1], dtype=ht.int64, device=cpu:0, split=None)
     """
-    dtypes = (heat_type_of(t1), heat_type_of(t2))
-    arrs = [t1, t2]
-    for dt in range(2):
-        if heat_type_is_inexact(dtypes[dt]):
-            raise TypeError("Operation is not supported for float types")
-        elif dtypes[dt] == types.bool:
-            arrs[dt] = types.int(arrs[dt])
+    if heat_type_is_inexact(heat_type_of(t1)) or heat_type_is_inexact(heat_type_of(t2)):
+        raise TypeError("Operation is not supported for float types")
 
     return _operations.__binary_op(torch.Tensor.__rshift__, t1, t2)
 
 
-DNDarray.__rshift__ = lambda self, other: right_shift(self, other)
-DNDarray.__rshift__.__doc__ = right_shift.__doc__
+DNDarray.__rshift__ = right_shift
 
 
 def prod(
@@ -911,11 +934,12 @@ def prod(
     )
 
 
-DNDarray.prod = lambda self, axis=None, out=None, keepdim=None: prod(self, axis, out, keepdim)
-DNDarray.prod.__doc__ = prod.__doc__
+DNDarray.prod = prod
 
 
-def sub(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
+def sub(
+    t1: Union[DNDarray, float], t2: Union[DNDarray, float], out: Optional[DNDarray] = None
+) -> DNDarray:
     """
     Element-wise subtraction of values of operand ``t2`` from values of operands ``t1`` (i.e ``t1-t2``)
     Operation is not commutative.
@@ -926,6 +950,9 @@ def sub(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
         The first operand from which values are subtracted
     t2: DNDarray or scalar
         The second operand whose values are subtracted
+    out: DNDarray, optional
+        The output array. It must have a shape that the inputs broadcast to and matching split axis.
+        If not provided, a freshly allocated array is returned.
 
     Examples
     --------
@@ -941,11 +968,10 @@ def sub(t1: Union[DNDarray, float], t2: Union[DNDarray, float]) -> DNDarray:
     DNDarray([[ 1.,  0.],
               [-1., -2.]], dtype=ht.float32, device=cpu:0, split=None)
     """
-    return _operations.__binary_op(torch.sub, t1, t2)
+    return _operations.__binary_op(torch.sub, t1, t2, out)
 
 
-DNDarray.__sub__ = lambda self, other: sub(self, other)
-DNDarray.__sub__.__doc__ = sub.__doc__
+DNDarray.__sub__ = sub
 DNDarray.__rsub__ = lambda self, other: sub(other, self)
 DNDarray.__rsub__.__doc__ = sub.__doc__
 
@@ -1000,4 +1026,4 @@ def sum(
     )
 
 
-DNDarray.sum = lambda self, axis=None, out=None, keepdim=None: sum(self, axis, out, keepdim)
+DNDarray.sum = sum
@@ -1,6 +1,7 @@
 """Enables parallel I/O with data on disk."""
 from __future__ import annotations
 
+import contextlib
 import os.path
 from math import log10
 import numpy as np
@@ -115,22 +116,26 @@ else:
         device = devices.sanitize_device(device)
         comm = sanitize_comm(comm)
 
-        # actually load the data from the HDF5 file
-        with h5py.File(path, "r") as handle:
+        # actually load the data from the HDF5 file, in parallel via MPI-IO if possible
+        if h5py.get_config().mpi:
+            handle = h5py.File(path, "r", driver="mpio", comm=comm.handle)
+        else:
+            handle = h5py.File(path, "r")
+
+        with handle:
             data = handle[dataset]
             gshape = tuple(data.shape)
             dims = len(gshape)
             split = sanitize_axis(gshape, split)
             _, _, indices = comm.chunk(gshape, split)
             balanced = True
-            if split is None:
-                data = torch.tensor(
-                    data[indices], dtype=dtype.torch_type(), device=device.torch_device
-                )
-            elif indices[split].stop > indices[split].start:
-                data = torch.tensor(
-                    data[indices], dtype=dtype.torch_type(), device=device.torch_device
-                )
+            # every process reads its own slab, let MPI-IO merge them into collective reads
+            transfer = data.collective if h5py.get_config().mpi else contextlib.nullcontext()
+            if split is None or indices[split].stop > indices[split].start:
+                with transfer:
+                    data = torch.tensor(
+                        data[indices], dtype=dtype.torch_type(), device=device.torch_device
+                    )
             else:
                 warnings.warn("More MPI ranks are used then the length of splitting dimension!")
                 slice1 = tuple(
@@ -139,9 +144,10 @@ else:
                 slice2 = tuple(
                     slice(0, gshape[i]) if i != split else slice(0, 0) for i in range(dims)
                 )
-                data = torch.tensor(
-                    data[slice1], dtype=dtype.torch_type(), device=device.torch_device
-                )
+                with transfer:
+                    data = torch.tensor(
+                        data[slice1], dtype=dtype.torch_type(), device=device.torch_device
+                    )
                 data = data[slice2]
 
             return DNDarray(data, gshape, dtype, split, device, comm, balanced)
@@ -1,17 +1,23 @@
 """Provides a collection of signal-processing operations"""
 
 import torch
+import torch.fft
 from typing import Union, Tuple, Sequence
 
 from .communication import MPI
 from .dndarray import DNDarray
-from .types import promote_types
+from .types import promote_types, issubdtype, floating
 from .manipulations import pad
 from .factories import array
 import torch.nn.functional as fc
 
 __all__ = ["convolve"]
 
+# filter size from which on the local convolution is computed in frequency space. Measured on a
+# single CPU core for float32 signals of 4e3 to 1e6 elements, direct correlation and 2-3-5-smooth
+# real FFTs broke even at 512 to 768 taps, at 1024 taps the FFTs were about twice as fast.
+__FFT_FILTER_SIZE = 1024
+
 
 def convolve(a: DNDarray, v: DNDarray, mode: str = "full") -> DNDarray:
     """
@@ -102,47 +108,157 @@ def convolve(a: DNDarray, v: DNDarray, mode: str = "full") -> DNDarray:
     else:
         raise ValueError("Supported modes are 'full', 'valid', 'same', got {}".format(mode))
 
-    a = pad(a, pad_size, "constant", 0)
-
+    # distributed signals need the zeros in place for the halo exchange, otherwise conv1d pads
     if a.is_distributed():
-        if (v.shape[0] > a.lshape_map[:, 0]).any():
-            raise ValueError("Filter weight is larger than the local chunks of signal")
-        # fetch halos and store them in a.halo_next/a.halo_prev
-        a.get_halo(halo_size)
-        # apply halos to local array
-        signal = a.array_with_halos
-    else:
-        signal = a.larray
-
-    # make signal and filter weight 3D for Pytorch conv1d function
-    signal = signal.reshape(1, 1, signal.shape[0])
+        a = pad(a, pad_size, "constant", 0)
 
     # flip filter for convolution as Pytorch conv1d computes correlations
+    signal = a.larray
     weight = v.larray.flip(dims=(0,))
-    weight = weight.reshape(1, 1, weight.shape[0])
 
-    # cast to float if on GPU
-    if signal.is_cuda:
+    # cast to float if on GPU, signal and filter weight share the promoted type
+    if signal.is_cuda and not signal.is_floating_point():
         float_type = promote_types(signal.dtype, torch.float32).torch_type()
         signal = signal.to(float_type)
         weight = weight.to(float_type)
 
-    # apply torch convolution operator
-    signal_filtered = fc.conv1d(signal, weight)
+    # large filter weights are cheaper in frequency space, integer results must stay exact though
+    fft = v.shape[0] >= __FFT_FILTER_SIZE and issubdtype(a.dtype, floating)
 
-    # unpack 3D result into 1D
-    signal_filtered = signal_filtered[0, 0, :]
+    if a.is_distributed():
+        # only the smallest chunk matters, no need to assemble the full lshape map
+        if v.shape[0] > a.comm.allreduce(a.lshape[0], op=MPI.MIN):
+            raise ValueError("Filter weight is larger than the local chunks of signal")
 
-    # if kernel shape along split axis is even we need to get rid of duplicated values
-    if a.comm.rank != 0 and v.shape[0] % 2 == 0:
-        signal_filtered = signal_filtered[1:]
+        # exchange the halos with the neighboring processes in the background, together they
+        # provide the M - 1 values the boundaries need, the previous one is shorter for even M
+        rank, size = a.comm.rank, a.comm.size
+        prev_size, next_size = (v.shape[0] - 1) // 2, v.shape[0] // 2
+        halo_prev, halo_next = None, None
+        requests = []
+        if rank > 0:
+            if prev_size > 0:
+                halo_prev = torch.empty(prev_size, dtype=signal.dtype, device=signal.device)
+                requests.append(a.comm.Irecv(halo_prev, source=rank - 1))
+            if next_size > 0:
+                requests.append(a.comm.Isend(signal[:next_size], rank - 1))
+        if rank < size - 1:
+            if next_size > 0:
+                halo_next = torch.empty(next_size, dtype=signal.dtype, device=signal.device)
+                requests.append(a.comm.Irecv(halo_next, source=rank + 1))
+            if prev_size > 0:
+                requests.append(a.comm.Isend(signal[signal.shape[0] - prev_size :], rank + 1))
+
+        # meanwhile, filter the interior that does not depend on the halos
+        signal_filtered = __conv1d(signal, weight, fft=fft)
+        for request in requests:
+            request.Wait()
+
+        # filter the boundaries reaching into the halos
+        overlap = v.shape[0] - 1
+        if halo_prev is not None:
+            boundary = __conv1d(torch.cat((halo_prev, signal[:overlap])), weight, fft=fft)
+            signal_filtered = torch.cat((boundary, signal_filtered))
+        if halo_next is not None:
+            boundary = __conv1d(
+                torch.cat((signal[signal.shape[0] - overlap :], halo_next)), weight, fft=fft
+            )
+            signal_filtered = torch.cat((signal_filtered, boundary))
+    else:
+        signal_filtered = __conv1d(signal, weight, pad_size, fft)
 
     return DNDarray(
-        signal_filtered.contiguous(),
+        signal_filtered.to(a.dtype.torch_type()),
         (gshape,),
-        signal_filtered.dtype,
+        a.dtype,
         a.split,
         a.device,
         a.comm,
         balanced=False,
-    ).astype(a.dtype.torch_type())
+    )
+
+
+def __conv1d(
+    signal: torch.Tensor, weight: torch.Tensor, padding: int = 0, fft: bool = False
+) -> torch.Tensor:
+    """
+    Computes the valid cross-correlation of two one-dimensional tensors, either directly or in
+    frequency space.
+
+    Parameters
+    ----------
+    signal : torch.Tensor
+        One-dimensional signal of shape (N,)
+    weight : torch.Tensor
+        One-dimensional filter weight of shape (M,), with M <= N
+    padding : int, optional
+        Number of implicit zeros on both sides of the signal
+    fft : bool, optional
+        Whether to compute the correlation via FFTs, only suitable for floating point inputs
+    """
+    if fft:
+        return __fft_conv1d(signal, weight, padding)
+
+    # make signal and filter weight 3D for Pytorch conv1d function
+    signal_filtered = fc.conv1d(
+        signal.reshape(1, 1, signal.shape[0]),
+        weight.reshape(1, 1, weight.shape[0]),
+        padding=padding,
+    )
+
+    # unpack 3D result into 1D
+    return signal_filtered[0, 0, :]
+
+
+def __fft_conv1d(signal: torch.Tensor, weight: torch.Tensor, padding: int = 0) -> torch.Tensor:
+    """
+    Computes the same valid cross-correlation of two one-dimensional tensors as
+    ``torch.nn.functional.conv1d``, but via real-valued FFTs in :math:`O(N \\log N)` instead of
+    :math:`O(NM)`.
+
+    Parameters
+    ----------
+    signal : torch.Tensor
+        One-dimensional floating point signal of shape (N,)
+    weight : torch.Tensor
+        One-dimensional floating point filter weight of shape (M,), with M <= N
+    padding : int, optional
+        Number of implicit zeros on both sides of the signal
+    """
+    length = signal.shape[0] + 2 * padding
+    # chunk lengths are arbitrary, lengths with large prime factors transform several times slower
+    n = __next_fast_len(length)
+
+    # the circular wrap-around only pollutes values past the result, extra zeros push it further out
+    spectrum = torch.fft.rfft(signal, n=n) * torch.fft.rfft(weight, n=n).conj()
+    signal_filtered = torch.fft.irfft(spectrum, n=n)
+
+    # the leading zeros shift the result, their values are found at the end of the circular one
+    if padding > 0:
+        signal_filtered = signal_filtered.roll(padding)
+
+    return signal_filtered[: length - weight.shape[0] + 1]
+
+
+def __next_fast_len(n: int) -> int:
+    """
+    Returns the smallest 2-3-5-smooth number, i.e. :math:`2^i 3^j 5^k`, that is greater than or equal to ``n``.
+    FFTs of such lengths are efficient in all FFT backends of torch.
+
+    Parameters
+    ----------
+    n : int
+        Minimal transform length
+    """
+    best = 1 << (n - 1).bit_length()
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            # smallest power of two that lifts the odd part to at least n
+            quotient = -(-n // power35)
+            best = min(best, (1 << (quotient - 1).bit_length()) * power35)
+            power35 *= 3
+        power5 *= 5
+
+    return best
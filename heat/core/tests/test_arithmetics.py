@@ -35,6 +35,14 @@ class TestArithmetics(TestCase):
         self.assertTrue(ht.equal(ht.add(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.add(self.a_split_tensor, self.a_tensor), result))
 
+        out = ht.empty((2, 2))
+        res = ht.add(self.a_tensor, self.a_scalar, out=out)
+        self.assertTrue(ht.equal(out, result))
+        self.assertIs(res, out)
+        b = ht.array([[1.0, 2.0], [3.0, 4.0]])
+        ht.add(b, self.another_tensor, out=b)
+        self.assertTrue(ht.equal(b, result))
+
         # Single element split
         a = ht.array([1], split=0)
         b = ht.array([1, 2], split=0)
@@ -336,6 +344,17 @@ class TestArithmetics(TestCase):
         self.assertEqual(ht_diff.split, 1)
         self.assertEqual(ht_diff.dtype, ht_array.dtype)
 
+        # n close to or beyond the split length, chunks run empty in between the passes
+        size = ht_array.comm.size
+        for length in (max(size - 1, 1), size, size + 1, 5):
+            for nl in range(1, length + 2):
+                ht_diff = ht.diff(ht.arange(length, split=0) ** 2, n=nl)
+                np_diff = np.diff(np.arange(length) ** 2, n=nl)
+                self.assertEqual(ht_diff.shape, np_diff.shape)
+                self.assertEqual(ht_diff.split, 0)
+                if np_diff.size > 0:
+                    self.assertTrue(np.array_equal(ht_diff.numpy(), np_diff))
+
         # raises
         with self.assertRaises(ValueError):
             ht.diff(ht_array, n=-2)
@@ -499,6 +518,12 @@ class TestArithmetics(TestCase):
         self.assertTrue(ht.equal(ht.mul(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.mul(self.a_split_tensor, self.a_tensor), result))
 
+        out = ht.empty((2, 2), split=self.a_split_tensor.split)
+        res = ht.mul(self.a_split_tensor, self.a_tensor, out=out)
+        self.assertTrue(ht.equal(out, result))
+        self.assertIs(res, out)
+        self.assertEqual(self.a_split_tensor.split, out.split)
+
         with self.assertRaises(ValueError):
             ht.mul(self.a_tensor, self.another_vector)
         with self.assertRaises(TypeError):
@@ -544,6 +569,14 @@ class TestArithmetics(TestCase):
         self.assertTrue(ht.equal(ht.pow(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.pow(self.a_split_tensor, self.a_tensor), commutated_result))
 
+        # small integer exponents
+        int_tensor = ht.arange(-3, 5, split=0)
+        for exponent in (2, 3, 4):
+            int_result = int_tensor**exponent
+            self.assertEqual(int_result.dtype, int_tensor.dtype)
+            self.assertEqual(int_result.split, 0)
+            self.assertTrue(ht.equal(int_result, ht.array([i**exponent for i in range(-3, 5)])))
+
         with self.assertRaises(ValueError):
             ht.pow(self.a_tensor, self.another_vector)
         with self.assertRaises(TypeError):
@@ -646,6 +679,13 @@ class TestArithmetics(TestCase):
         self.assertEqual(shape_split_axis_tuple_prod.split, None)
         self.assertTrue((shape_split_axis_tuple_prod == expected_result).all())
 
+        # adjacent and non-adjacent tuple axes
+        a = ht.arange(1, 25, dtype=ht.float64, split=0).reshape((2, 3, 4))
+        np_a = a.numpy()
+        for axes in [(1, 2), (0, 1), (0, 2)]:
+            ht_prod = a.prod(axis=axes)
+            self.assertTrue(np.allclose(ht_prod.numpy(), np_a.prod(axis=axes)))
+
         # exceptions
         with self.assertRaises(ValueError):
             ht.ones(array_len).prod(axis=1)
@@ -681,6 +721,11 @@ class TestArithmetics(TestCase):
         self.assertTrue(ht.equal(ht.sub(self.a_tensor, self.an_int_scalar), result))
         self.assertTrue(ht.equal(ht.sub(self.a_split_tensor, self.a_tensor), minus_result))
 
+        out = ht.empty((2, 2))
+        res = ht.sub(self.a_tensor, self.a_scalar, out=out)
+        self.assertTrue(ht.equal(out, result))
+        self.assertIs(res, out)
+
         with self.assertRaises(ValueError):
             ht.sub(self.a_tensor, self.another_vector)
         with self.assertRaises(TypeError):
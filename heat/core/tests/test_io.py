@@ -2,6 +2,7 @@ import numpy as np
 import os
 import torch
 import tempfile
+import warnings
 
 import heat as ht
 from .test_suites.basic_test import TestCase
@@ -556,6 +557,37 @@ class TestIO(TestCase):
         self.assertEqual(iris.dtype, ht.int8)
         self.assertEqual(iris.larray.dtype, torch.int8)
 
+    def test_load_hdf5_parallel(self):
+        # parallel HDF5 support is optional
+        if not ht.io.supports_hdf5() or not ht.io.h5py.get_config().mpi:
+            self.skipTest("Requires parallel HDF5")
+
+        # every process reads the entire dataset
+        iris = ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, split=None)
+        self.assertEqual(iris.split, None)
+        self.assertTrue((self.IRIS == iris.larray).all())
+
+        # every process reads its own slab
+        iris = ht.load_hdf5(self.HDF5_PATH, self.HDF5_DATASET, split=0)
+        self.assertEqual(iris.split, 0)
+        self.assertTrue((self.IRIS == iris.resplit(None).larray).all())
+
+        # more processes than rows, the empty ones still take part in the collective read
+        if ht.MPI_WORLD.size > 1:
+            rows = ht.MPI_WORLD.size - 1
+            if ht.MPI_WORLD.rank == 0:
+                with ht.io.h5py.File(self.HDF5_OUT_PATH, "w") as handle:
+                    handle.create_dataset(self.HDF5_DATASET, data=self.IRIS[:rows].cpu().numpy())
+            ht.MPI_WORLD.Barrier()
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                data = ht.load_hdf5(self.HDF5_OUT_PATH, self.HDF5_DATASET, split=0)
+            self.assertEqual(data.shape, (rows, self.IRIS.shape[1]))
+            if ht.MPI_WORLD.rank == ht.MPI_WORLD.size - 1:
+                self.assertEqual(data.lshape[0], 0)
+            self.assertTrue((self.IRIS[:rows] == data.resplit(None).larray).all())
+
     def test_load_hdf5_exception(self):
         # HDF5 support is optional
         if not ht.io.supports_hdf5():
@@ -81,3 +81,31 @@ class TestSignal(TestCase):
         kernel = ht.ones(1).astype(ht.int)
         conv = ht.convolve(alt_signal, kernel)
         self.assertTrue(ht.equal(signal, conv))
+
+        # non-distributed signal, even-sized kernel
+        conv = ht.convolve(signal, kernel_even)
+        self.assertTrue(ht.equal(full_even, conv))
+
+        # large filter weights are convolved in frequency space
+        np.random.seed(42)
+        np_signal = np.random.randn(1100 * self.comm.size)
+        np_kernel = np.random.randn(1025)
+        signal = ht.array(np_signal, split=0)
+        kernel = ht.array(np_kernel)
+        for mode in ["full", "same", "valid"]:
+            conv = ht.convolve(signal, kernel, mode=mode)
+            gathered = manipulations.resplit(conv, axis=None)
+            self.assertTrue(
+                ht.allclose(gathered, ht.array(np.convolve(np_signal, np_kernel, mode)))
+            )
+
+        # ... except for integers, which have to stay exact
+        np_signal = np.random.randint(-50, 50, size=1100 * self.comm.size)
+        np_kernel = np.random.randint(-50, 50, size=1025)
+        signal = ht.array(np_signal, split=0)
+        kernel = ht.array(np_kernel)
+        for mode in ["full", "same", "valid"]:
+            conv = ht.convolve(signal, kernel, mode=mode)
+            gathered = manipulations.resplit(conv, axis=None)
+            self.assertEqual(gathered.dtype, signal.dtype)
+            self.assertTrue(ht.equal(gathered, ht.array(np.convolve(np_signal, np_kernel, mode))))
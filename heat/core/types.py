@@ -429,14 +429,17 @@ cdouble = complex128
 
 _complexfloating = (complex64, complex128)
 
-_inexact = (
-    # float16,
-    float32,
-    float64,
-    *_complexfloating,
+# sets for constant-time membership checks
+_inexact = frozenset(
+    (
+        # float16,
+        float32,
+        float64,
+        *_complexfloating,
+    )
 )
 
-_exact = (uint8, int8, int16, int32, int64)
+_exact = frozenset((uint8, int8, int16, int32, int64))
 
 # type mappings for type strings and builtins types
 __type_mappings = {
@@ -53,14 +53,12 @@ class TestDASO(TestCase):
                 if not self.test_set:
                     ht.utils.data.dataset_shuffle(self, attrs=[["data", None]])
 
-        def train(model, device, optimizer, target, batches=20, scaler=None):
+        def train(model, optimizer, data, target, batches=20, scaler=None):
             model.train()
             optimizer.last_batch = batches - 1
             loss_fn = torch.nn.MSELoss()
-            torch.random.manual_seed(10)
-            data = torch.rand(batches, 2, 1, 32, 32, device=ht.get_device().torch_device)
             for b in range(batches):
-                d, t = data[b].to(device), target[b].to(device)
+                d, t = data[b], target[b]
                 optimizer.zero_grad()
                 if scaler is not None:
                     with torch.cuda.amp.autocast():
@@ -163,9 +161,12 @@ class TestDASO(TestCase):
         )
         dp_model = ht.nn.DataParallelMultiGPU(model, daso_optimizer)
 
-        target = torch.rand((20, 2, 10), device=ht.get_device().torch_device)
+        # the same batches are used in every epoch, generate them once on the training device
+        torch.random.manual_seed(10)
+        data = torch.rand((20, 2, 1, 32, 32), device=device)
+        target = torch.rand((20, 2, 10), device=device)
         for epoch in range(epochs):
-            ls = train(dp_model, device, daso_optimizer, target, batches=20)
+            ls = train(dp_model, daso_optimizer, data, target, batches=20)
             if epoch == 0:
                 first_ls = ls
             daso_optimizer.epoch_loss_logic(ls)
@@ -191,7 +192,7 @@ class TestDASO(TestCase):
         scaler = torch.cuda.amp.GradScaler()
         daso_optimizer.add_scaler(scaler)
         for epoch in range(epochs):
-            ls = train(dp_model, device, daso_optimizer, target, batches=20, scaler=scaler)
+            ls = train(dp_model, daso_optimizer, data, target, batches=20, scaler=scaler)
             if epoch == 0:
                 first_ls = ls
             daso_optimizer.epoch_loss_logic(ls, loss_globally_averaged=True)
@@ -2,7 +2,6 @@
 Module for (pairwise) distance functions
 """
 import torch
-import numpy as np
 from mpi4py import MPI
 from typing import Callable
 
@@ -59,8 +58,9 @@ def _quadratic_expand(x: torch.tensor, y: torch.tensor) -> torch.tensor:
     y_t = torch.transpose(y, 0, 1)
     y_norm = (y**2).sum(1).view(1, -1)
 
-    dist = x_norm + y_norm - 2.0 * torch.mm(x, y_t)
-    return torch.clamp(dist, 0.0, np.inf)
+    # scale and accumulate the cross term inside the matrix product
+    dist = torch.addmm(y_norm, x, y_t, alpha=-2.0).add_(x_norm)
+    return dist.clamp_(min=0.0)
 
 
 def _gaussian(x: torch.tensor, y: torch.tensor, sigma: float = 1.0) -> torch.tensor: